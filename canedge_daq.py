@@ -1,7 +1,15 @@
 import argparse
-from utils import CANedgeDAQ
+import logging
+import os
+import sys
+from utils import CANedgeDAQ, default_a2l_cache_dir
 from pathlib import Path
-import math
+
+# Log formatter showing progress info as plain lines and prefixing warnings/errors with their level (e.g. "WARNING: ...")
+class LevelPrefixFormatter(logging.Formatter):
+    def format(self, record):
+        message = super().format(record)
+        return message if record.levelno <= logging.INFO else f"{record.levelname}: {message}"
 
 # Parse command-line arguments
 def parse_args():
@@ -13,6 +21,8 @@ def parse_args():
     parser.add_argument("signal_file", type=Path, help="Path to the CSV-style signal file to use for filtering signals. Example: path/to/signal_file.csv")
     parser.add_argument("--a2l", type=Path, nargs="+", required=True, help="One or more A2L files. Example: --a2l abc.a2l xyz.a2l.")
     parser.add_argument("--default_params", type=Path, default=None, help="Path to default a2l parameters JSON file used when A2L file lacks relevant CCP/XCP section.")
+    parser.add_argument("--a2l_cache_dir", type=Path, default=default_a2l_cache_dir(), help="Directory for caching parsed A2L files between runs (default: %%LOCALAPPDATA%%\\canedge_daq\\cache on Windows, ~/.cache/canedge_daq elsewhere).")
+    parser.add_argument("--no_cache", action="store_true", help="Disable the A2L parse cache and always reparse the A2L file(s).")
 
     return parser.parse_args()
 
@@ -20,12 +30,18 @@ def parse_args():
 if __name__ == "__main__":
     args = parse_args()
 
-    # Ensure paths are absolute
-    output_dbc = args.output_dbc.resolve()
-    output_transmit = args.output_transmit.resolve()
-    signal_file = args.signal_file.resolve()
-    a2l_files = [path.resolve() for path in args.a2l]
+    # Show progress info, warnings and errors from utils.py in line with the regular output
+    log_handler = logging.StreamHandler(sys.stdout)
+    log_handler.setFormatter(LevelPrefixFormatter("%(message)s"))
+    logging.basicConfig(handlers=[log_handler], level=logging.INFO)
+
+    # Ensure paths are absolute (outputs may not exist yet, inputs must exist)
+    output_dbc = Path(os.path.abspath(args.output_dbc))
+    output_transmit = Path(os.path.abspath(args.output_transmit))
+    signal_file = args.signal_file.resolve(strict=True)
+    a2l_files = [path.resolve(strict=True) for path in args.a2l]
     default_params_file = args.default_params.resolve() if args.default_params else None
+    a2l_cache_dir = None if args.no_cache else args.a2l_cache_dir.resolve()
 
     # Print parsed arguments for debugging
     print("\nParsed arguments:")
@@ -35,12 +51,10 @@ if __name__ == "__main__":
     print(f"A2L file(s): {a2l_files}")
     if default_params_file:
         print(f"Default params file: {default_params_file}")
+    if a2l_cache_dir:
+        print(f"A2L cache directory: {a2l_cache_dir}")
     print()
 
-    # Ensure signal file exists
-    if not signal_file.exists():
-        raise FileNotFoundError(f"Signal file not found: {signal_file}")
-
     # Settings for script
     settings = {
         "start_delay": 1000,     # ms before the first CTO
@@ -52,7 +66,7 @@ if __name__ == "__main__":
     }
     
     # Initialize CANedgeDAQ Class 
-    cdaq = CANedgeDAQ(a2l_files, signal_file, default_params_file)
+    cdaq = CANedgeDAQ(a2l_files, signal_file, default_params_file, a2l_cache_dir)
 
     # Load A2L files into dictionary and identify protocol
     a2l_dict = cdaq.load_a2l_files()
@@ -74,8 +88,15 @@ if __name__ == "__main__":
     # a2l_params["MAX_CTO"] = "0x40"
     # a2l_params["MAX_DTO"] = "0x0040"
     
-    print(f"\nRequested signals: {len(user_signals)} | Available signals: {len(a2l_signals_all)} | Matched signals: {len(signals)} ({math.floor((len(signals)/len(user_signals))*100)}%)")
-    print(f"A2L settings: MAX_CTO: {int(a2l_params['MAX_CTO'],16)} | MAX_DTO: {int(a2l_params['MAX_DTO'],16)} | BYTE_ORDER: {a2l_params['BYTE_ORDER']} | CAN_FD: {a2l_params['CAN_FD']}")
+    # Derive the integer parameters used downstream (so any hardcoded values above take effect)
+    cdaq.add_numeric_params(a2l_params)
+    
+    # Requested signals matched via set intersection (matrix signals count once via their base name)
+    matched_user_signals = user_signals.keys() & cdaq.matched_signals
+    matched_pct = (len(matched_user_signals) * 100 // len(user_signals)) if user_signals else 0
+    
+    print(f"\nRequested signals: {len(user_signals)} | Available signals: {len(a2l_signals_all)} | Matched signals: {len(signals)} | Matched requested signals: {len(matched_user_signals)} ({matched_pct}%)")
+    print(f"A2L settings: MAX_CTO: {a2l_params['MAX_CTO_INT']} | MAX_DTO: {a2l_params['MAX_DTO_INT']} | BYTE_ORDER: {a2l_params['BYTE_ORDER']} | CAN_FD: {a2l_params['CAN_FD']}")
     print(f"              MAX_DLC_REQUIRED: {a2l_params.get('MAX_DLC_REQUIRED', False)} | pack_consecutive_bytes: {settings['pack_consecutive_bytes']}\n")
 
     # Generate status CSV showing which signals were matched/not matched
@@ -92,4 +113,5 @@ if __name__ == "__main__":
 
     # Create and save outputs
     cdaq.create_transmit_list(daq_frames, a2l_params, settings, output_transmit)
-    cdaq.create_dbc(signals_grouped, a2l_params, output_dbc, settings, protocol)
+    dbc_signal_names = cdaq.create_dbc_signal_names(signals_grouped, settings)
+    cdaq.create_dbc(signals_grouped, a2l_params, output_dbc, settings, protocol, dbc_signal_names)
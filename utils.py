@@ -1,41 +1,111 @@
-import sys, json
+import sys, io, json, os, csv, math, shutil, struct, pickle, hashlib, logging, contextlib, functools
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from types import MappingProxyType
+
+from a2lparser.a2lparser import A2LParser
+from a2lparser.a2lparser_exception import A2LParserException
+
+# optional C-accelerated JSON encoder/decoder (falls back to the standard library json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# logger for progress info, warnings and errors (canedge_daq.py prints INFO and above to stdout)
+logger = logging.getLogger(__name__)
+
+# separator used in expanded matrix signal names (base_name_MX_index format)
+_MX_SUFFIX = "_MX_"
+
+# pre-formatted 1-byte hex strings ("00" to "FF") and labels used for ODT and ODT entry numbers ("0x00" to "0xFF")
+_HEX_1B = tuple(f"{i:02X}" for i in range(256))
+_HEX_LABELS_1B = tuple(f"0x{h}" for h in _HEX_1B)
+
+# ----------------------------------
+# function for formatting a non-zero number with up to 10 decimals and no trailing zeros (cached, as most compu methods share a few coefficients)
+@functools.lru_cache(maxsize=4096)
+def _format_decimal(value):
+    return f"{value:.10f}".rstrip('0').rstrip('.')
+
+# ----------------------------------
+# function for loading a JSON file (parsed with orjson if available)
+def load_json(path):
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+# ----------------------------------
+# function for getting the platform cache directory for parsed A2L files (%LOCALAPPDATA% on Windows, XDG cache dir elsewhere)
+def default_a2l_cache_dir():
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+        return Path(base_dir) / "canedge_daq" / "cache"
+    base_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base_dir) / "canedge_daq"
+
+# ----------------------------------
+# function for extracting the base name of an expanded matrix signal (returns None if not a matrix signal)
+def matrix_base_name(signal_name):
+    parts = signal_name.rsplit(_MX_SUFFIX, 1)
+    if len(parts) == 2 and parts[0] and parts[1].isascii() and parts[1].isdigit():
+        return parts[0]
+    return None
+
+# ----------------------------------
+# function for creating a CCP command frame in hex (command byte, counter byte and 6 parameter bytes padded with 0xAA)
+_CCP_CRO = struct.Struct(">BB6s")
+
+def ccp_frame(command, counter, params=b""):
+    return _CCP_CRO.pack(command, counter, params.ljust(6, b"\xAA")).hex().upper()
 
 # ----------------------------------
-# function for creating the CCP counter in hex
-def ctr_hex(counter):
-    return counter.to_bytes(1, 'big').hex().upper()
+# function for parsing a single A2L file (module level so it can be used by worker processes)
+def _parse_one_a2l(a2l_file):
+    sys.stdout.reconfigure(encoding="utf-8")  # worker processes do not inherit the reconfigured stdout (spawned on Windows)
+
+    # Capture the parser's progress output so parallel workers do not interleave it (printed by the parent in file order)
+    parser_output = io.StringIO()
+    with contextlib.redirect_stdout(parser_output):
+        parser = A2LParser(log_level="INFO")
+        parsed_data = parser.parse_file(str(a2l_file))
+    return parsed_data, parser_output.getvalue()
     
 class CANedgeDAQ:
+    # A2L data types mapped to (signage, byte length) - read-only and shared by all instances
+    data_type_map = MappingProxyType({
+        "uchar": ("unsigned", 1),
+        "schar": ("signed", 1),
+        "ubyte": ("unsigned", 1),
+        "sbyte": ("signed", 1),
+        "uword": ("unsigned", 2),
+        "sword": ("signed", 2),
+        "slong": ("signed", 4),
+        "a_uint64": ("unsigned", 8),
+        "a_int64": ("signed", 8),
+        "char": ("signed", 1),
+        "uint": ("unsigned", 2),
+        "int": ("signed", 2),
+        "ulong": ("unsigned", 4),
+        "long": ("signed", 4),
+        "float": ("float", 4),
+        "float32_ieee": ("float", 4),
+        "float64_ieee": ("double", 8)
+    })
+
     # Initialize class
-    def __init__(self, a2l_files, signal_file, default_params_file=None):
+    def __init__(self, a2l_files, signal_file, default_params_file=None, a2l_cache_dir=None):
         self.a2l_files = a2l_files 
         self.signal_file = signal_file
         self.default_params_file = default_params_file
+        self.a2l_cache_dir = a2l_cache_dir  # Directory for cached A2L parse results (None disables caching)
         self.matched_signals = set()  # Store matched signal names
-        self.data_type_map = {
-            "uchar": ("unsigned", 1),
-            "schar": ("signed", 1),
-            "ubyte": ("unsigned", 1),
-            "sbyte": ("signed", 1),
-            "uword": ("unsigned", 2),
-            "sword": ("signed", 2),
-            "slong": ("signed", 4),
-            "a_uint64": ("unsigned", 8),
-            "a_int64": ("signed", 8),
-            "char": ("signed", 1),
-            "uint": ("unsigned", 2),
-            "int": ("signed", 2),
-            "ulong": ("unsigned", 4),
-            "long": ("signed", 4),
-            "float": ("float", 4),
-            "float32_ieee": ("float", 4),
-            "float64_ieee": ("double", 8)
-        }
         
     # ----------------------------------
     # helper function to clean output directory
     def clean_output_directory(self, output_dir):
-        import shutil
         if output_dir.exists() and output_dir.is_dir():
             for file in output_dir.iterdir():
                 if file.is_file():
@@ -54,88 +124,215 @@ class CANedgeDAQ:
             return None  # Return None if key is not found or no next value exists
         
     # ----------------------------------
-    # helper function for forcing integer value from A2L   
+    # helper function for mapping each keyword in an A2L DataParams list to its next value (first occurrence wins, as in get_next_value)
+    def get_key_value_map(self, data_list):
+        key_value_map = {}
+        for key, value in zip(data_list, data_list[1:]):
+            if isinstance(key, str) and key not in key_value_map:
+                key_value_map[key] = value
+        return key_value_map
+        
+    # ----------------------------------
+    # helper function for forcing integer value from A2L (hex values may use a 0x or 0X prefix)
     def force_int(self, element):
-        return int(element, 16) if isinstance(element, str) and element.startswith("0x") else int(element)
+        if type(element) is not str:
+            return int(element)
+        try:
+            return int(element, 0)  # base is detected from the prefix
+        except ValueError:
+            return int(element)  # decimal value with leading zeros (e.g. "010")
     
     # ----------------------------------
     # helper function for formatting numbers      
     def format_number(self,value):
         value = round(value, 10)  # Ensure full decimal precision
-        return "{:.10f}".format(value).rstrip('0').rstrip('.')  # Remove trailing zeros
+        if value == 0:
+            return "-0" if math.copysign(1.0, value) < 0 else "0"  # not cached, as -0.0 and 0.0 would share a cache entry
+        return _format_decimal(value)
                 
     # ----------------------------------
-    # helper function for parsing A2L CAN IDs       
+    # helper function for parsing A2L CAN IDs (returned as integers)
     def extract_can_id(self,can_id_str):
         can_id = int(can_id_str, 16)  # Convert string hex to integer
         
         if can_id & 0x80000000:  # Check if it's an extended ID (MSB set)
-            return hex(can_id & 0x1FFFFFFF), True  # Extract 29-bit ID
+            return can_id & 0x1FFFFFFF, True  # Extract 29-bit ID
         else:
-            return hex(can_id & 0x7FF), False  # Extract 11-bit ID
+            return can_id & 0x7FF, False  # Extract 11-bit ID
     
+    # ----------------------------------
+    # helper function for adding integer versions of hex parameters (and lookups) used repeatedly downstream
+    def add_numeric_params(self, a2l_params):
+        a2l_params["MAX_CTO_INT"] = int(a2l_params["MAX_CTO"], 16)
+        a2l_params["MAX_DTO_INT"] = int(a2l_params["MAX_DTO"], 16)
+        
+        # CAN IDs are kept as integers (default params files store them as hex strings)
+        for key in ("CAN_ID_MASTER", "CAN_ID_SLAVE", "CAN_ID_DTO"):
+            if isinstance(a2l_params.get(key), str):
+                a2l_params[key] = int(a2l_params[key], 16)
+        
+        # CCP DAQ lists by Id string and by numeric Id (first definition of an Id wins)
+        if "DAQ_LISTS" in a2l_params:
+            a2l_params["DAQ_LISTS_BY_ID"] = {}
+            a2l_params["DAQ_LISTS_BY_INT"] = {}
+            for daq_list in a2l_params["DAQ_LISTS"]:
+                a2l_params["DAQ_LISTS_BY_ID"].setdefault(daq_list["Id"], daq_list)
+                a2l_params["DAQ_LISTS_BY_INT"].setdefault(int(daq_list["Id"], 16), daq_list)
+        return a2l_params
+
+    # ----------------------------------
+    # helper function for getting the installed a2lparser version (cached parse results are invalidated on upgrades)
+    def get_a2lparser_version(self):
+        try:
+            return version("a2lparser")
+        except PackageNotFoundError:
+            return "unknown"
+
+    # ----------------------------------
+    # helper function for deriving the cache file path of an A2L file (<path hash>_<hash of path, file content and a2lparser version>.pkl)
+    def get_a2l_cache_path(self, a2l_file, parser_version):
+        path_hash = hashlib.sha256(str(a2l_file).encode("utf-8")).hexdigest()[:16]
+        cache_hash = hashlib.sha256(f"{a2l_file}|{parser_version}|".encode("utf-8"))
+        cache_hash.update(Path(a2l_file).read_bytes())
+        return Path(self.a2l_cache_dir) / f"{path_hash}_{cache_hash.hexdigest()}.pkl"
+
+    # ----------------------------------
+    # helper function for loading a cached A2L parse result (returns None if not cached)
+    def load_a2l_cache(self, cache_path):
+        if not cache_path.exists():
+            return None
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning("Ignoring unreadable A2L cache file %s: %s", cache_path, e)
+            return None
+
+    # ----------------------------------
+    # helper function for storing an A2L parse result in the cache (written to a temporary file first, then atomically replaced)
+    def save_a2l_cache(self, cache_path, parsed_data):
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(parsed_data, f, protocol=5)
+            os.replace(tmp_path, cache_path)
+
+            # Remove superseded cache files of the same A2L file (earlier file content or a2lparser version)
+            path_hash = cache_path.name.split("_", 1)[0]
+            for old_cache_path in cache_path.parent.glob(f"{path_hash}_*.pkl"):
+                if old_cache_path != cache_path:
+                    old_cache_path.unlink(missing_ok=True)
+        except Exception as e:
+            logger.warning("Unable to write A2L cache file %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    # ----------------------------------
+    # helper function for parsing A2L files in parallel worker processes (returns None if the parse results cannot be passed between processes)
+    def parse_a2l_files_parallel(self, a2l_files):
+        from concurrent.futures import ProcessPoolExecutor  # only imported when needed (noticeable import cost)
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(len(a2l_files), os.cpu_count() or 1)) as executor:
+                return list(executor.map(_parse_one_a2l, a2l_files))
+        except (pickle.PicklingError, TypeError, AttributeError, BrokenProcessPool) as e:
+            logger.warning("Parallel A2L parsing failed (%s) - parsing the A2L files one by one instead", e)
+            return None
+
     # ----------------------------------
     # function for loading A2L files into dictionary
     def load_a2l_files(self):
-        from a2lparser.a2lparser import A2LParser
-        from a2lparser.a2lparser_exception import A2LParserException
-        import sys
-
         sys.stdout.reconfigure(encoding="utf-8")
 
         a2l_dict = {}
+        parsed_files = {}
 
         try:
-            parser = A2LParser(log_level="INFO")
+            # Use the cached parse result if the A2L file is unchanged since it was cached
+            cache_paths = {}
+            parser_version = self.get_a2lparser_version() if self.a2l_cache_dir else None
             for a2l_file in self.a2l_files:
-                a2l_file = str(a2l_file)  # Ensure it's a string path
-                parsed_data = parser.parse_file(a2l_file)
-
-                # Merge parsed_data into a2l_dict
-                a2l_dict.update(parsed_data)  # parsed_data is already a dictionary
+                cache_paths[a2l_file] = self.get_a2l_cache_path(a2l_file, parser_version) if self.a2l_cache_dir else None
+                parsed_data = self.load_a2l_cache(cache_paths[a2l_file]) if cache_paths[a2l_file] else None
+                if parsed_data is not None:
+                    logger.info("Loaded cached A2L parse result for %s", a2l_file)
+                    parsed_files[a2l_file] = parsed_data
+
+            # Parse the remaining A2L files (in parallel worker processes if there are multiple, otherwise or as fallback one by one)
+            uncached_files = [a2l_file for a2l_file in self.a2l_files if a2l_file not in parsed_files]
+            parallel_results = self.parse_a2l_files_parallel(uncached_files) if len(uncached_files) > 1 else None
+            if parallel_results is not None:
+                for a2l_file, (parsed_data, parser_output) in zip(uncached_files, parallel_results):
+                    sys.stdout.write(parser_output)  # replay the parser's own progress output, as printed when parsing serially
+                    parsed_files[a2l_file] = parsed_data
+            elif uncached_files:
+                parser = A2LParser(log_level="INFO")
+                for a2l_file in uncached_files:
+                    parsed_files[a2l_file] = parser.parse_file(str(a2l_file))  # Ensure it's a string path
+
+            for a2l_file in uncached_files:
+                if cache_paths[a2l_file]:
+                    self.save_a2l_cache(cache_paths[a2l_file], parsed_files[a2l_file])
+
+            # Merge parsed_data into a2l_dict (in the order the A2L files were provided)
+            for a2l_file in self.a2l_files:
+                a2l_dict.update(parsed_files[a2l_file])  # parsed_data is already a dictionary
 
             return a2l_dict
 
         except A2LParserException as ex:
-            print(f"Error parsing A2L file: {ex}")
+            logger.error("Unable to parse A2L file: %s", ex)
             return {}
  
+    # ----------------------------------
+    # helper function for classifying the IF_DATA entries of an A2L AST in a single pass
+    def classify_if_data(self, ast):
+        if_data = ast["PROJECT"]["MODULE"]["IF_DATA"]
+        
+        # Ensure IF_DATA is a list
+        if isinstance(if_data, dict):
+            if_data = [if_data]
+        
+        # Keep the first CCP, XCP and XCP_ON_CAN entry
+        entries = {"ccp": None, "xcp": None, "xcp_on_can": None}
+        for entry in if_data:
+            if not isinstance(entry, dict):
+                continue
+            name = entry.get("Name", "")
+            if entries["ccp"] is None and "CCP" in name:
+                entries["ccp"] = entry
+            if entries["xcp"] is None and "XCP" in name:
+                entries["xcp"] = entry
+            if entries["xcp_on_can"] is None and "XCP_ON_CAN" in entry:
+                entries["xcp_on_can"] = entry
+
+        return entries
+
     # ----------------------------------
     # function for identifying the protocol (CCP or XCP) from A2L file
     def identify_protocol(self, a2l_dict):
-        import sys
-        
         try:
             for a2l_file_name, ast in a2l_dict.items():
-                if_data = ast["PROJECT"]["MODULE"]["IF_DATA"]
+                entries = self.classify_if_data(ast)
                 
-                # Ensure IF_DATA is a list
-                if isinstance(if_data, dict):
-                    if_data = [if_data]
-                
-                # Check for CCP section
-                ccp = next((entry for entry in if_data if "CCP" in entry.get("Name", "")), None)
-                if ccp is not None:
+                # CCP takes precedence over XCP within the same A2L file
+                if entries["ccp"] is not None:
                     return "ccp"
-                
-                # Check for XCP section
-                xcp = next((entry for entry in if_data if "XCP" in entry.get("Name", "")), None)
-                if xcp is not None:
+                if entries["xcp"] is not None:
                     return "xcp"
             
             # If neither found, default to XCP
-            print("WARNING: Could not identify protocol from A2L file. Defaulting to XCP.")
+            logger.warning("Could not identify protocol from A2L file - defaulting to XCP")
             return "xcp"
             
         except Exception as e:
-            print(f"ERROR: Failed to identify protocol: {str(e)}")
-            print("Defaulting to XCP.")
+            logger.error("Failed to identify protocol: %s - defaulting to XCP", e)
             return "xcp"
  
     # ----------------------------------
     # function for loading general CCP parameters from A2L files
     def load_a2l_params_ccp(self, a2l_dict):     
-        import json, sys, os
         
         # various fields are pre-defined in CCP due to lack of CAN FD support
         a2l_params = {} 
@@ -149,27 +346,22 @@ class CANedgeDAQ:
         try:
             # Attempt to extract parameters from A2L file
             for a2l_file_name, ast in a2l_dict.items():
-                if_data = ast["PROJECT"]["MODULE"]["IF_DATA"]
-        
-                # Ensure IF_DATA is a list or dictionary and standardize to a list for easier handling
-                if isinstance(if_data, dict):
-                    if_data = [if_data]
-
-                # Get CCP section and extract relevant information (find any entry with "CCP" in its name)
-                ccp = next((entry for entry in if_data if "CCP" in entry.get("Name", "")), None)
+                # Get CCP section and extract relevant information (first entry with "CCP" in its name)
+                ccp = self.classify_if_data(ast)["ccp"]
                 if ccp is None:
                     raise Exception("CCP section not found in A2L file")
                
                 a2l_params["VERSION"] = ccp["TP_BLOB"]["DataParams"][0]
                 a2l_params["CAN_ID_MASTER"], a2l_params["CAN_ID_MASTER_EXTENDED"] = self.extract_can_id(ccp["TP_BLOB"]["DataParams"][2])
                 a2l_params["CAN_ID_SLAVE"], a2l_params["CAN_ID_SLAVE_EXTENDED"] = self.extract_can_id(ccp["TP_BLOB"]["DataParams"][3])
-                a2l_params["BAUDRATE"] = self.force_int(self.get_next_value(ccp["TP_BLOB"]["DataParams"], "BAUDRATE")) 
+                tp_blob_values = self.get_key_value_map(ccp["TP_BLOB"]["DataParams"])
+                a2l_params["BAUDRATE"] = self.force_int(tp_blob_values.get("BAUDRATE")) 
                 a2l_params["BYTE_ORDER"] = 'big' if ccp["TP_BLOB"]["DataParams"][5] == '0x01' else 'little'
                 a2l_params["ECU_STATION_ADDRESS"] = ccp["TP_BLOB"]["DataParams"][4]
                 a2l_params["BYTES_ONLY"] = "BYTES_ONLY" in ccp["TP_BLOB"]["DataParams"]
 
                 # for simplicity we set the DAQ-DTO CAN ID equal to the slave CAN ID
-                a2l_params["CAN_ID_DTO"] = hex(int(a2l_params["CAN_ID_SLAVE"], 16))
+                a2l_params["CAN_ID_DTO"] = a2l_params["CAN_ID_SLAVE"]
                 a2l_params["CAN_ID_DTO_EXTENDED"] = a2l_params["CAN_ID_SLAVE_EXTENDED"]
 
                 # Add event data to list
@@ -194,55 +386,48 @@ class CANedgeDAQ:
                 a2l_params["DAQ_LISTS"] = daq_lists
 
             # print(json.dumps(a2l_params,indent=4))
-            return a2l_params
+            return self.add_numeric_params(a2l_params)
 
         except Exception as e:
             # If there's an error extracting from A2L, load from default JSON file
             if self.default_params_file is None or not os.path.exists(self.default_params_file):
-                print(f"\nERROR: Failed to extract a2l_params from A2L: {str(e)}")
-                print("ERROR: No default params file provided or file does not exist.")
+                logger.error("Failed to extract a2l_params from A2L: %s", e)
+                logger.error("No default params file provided or file does not exist")
                 sys.exit(1)
                 
             try:
-                print(f"\nWARNING: Failed to extract a2l_params from A2L: {str(e)}")
-                print(f"WARNING: Loading default parameters from {self.default_params_file}")
-                print("WARNING: Please review the default parameters to ensure they are valid for your ECU!")
+                logger.warning("Failed to extract a2l_params from A2L: %s", e)
+                logger.warning("Loading default parameters from %s", self.default_params_file)
+                logger.warning("Please review the default parameters to ensure they are valid for your ECU!")
                 
-                with open(self.default_params_file, 'r') as f:
-                    a2l_params = json.load(f)
-                return a2l_params
+                a2l_params = load_json(self.default_params_file)
+                return self.add_numeric_params(a2l_params)
                 
             except Exception as json_e:
-                print(f"ERROR: Failed to load default parameters: {str(json_e)}")
+                logger.error("Failed to load default parameters: %s", json_e)
                 sys.exit(1)
             
 
     # ----------------------------------
     # function for loading general XCP parameters from A2L files
     def load_a2l_params_xcp(self, a2l_dict):     
-        import json, sys, os
         
         a2l_params = {} 
         
         try:
             # Attempt to extract parameters from A2L file
             for a2l_file_name, ast in a2l_dict.items():
-                if_data = ast["PROJECT"]["MODULE"]["IF_DATA"]
-
-                # Ensure IF_DATA is a list or dictionary and standardize to a list for easier handling
-                if isinstance(if_data, dict):
-                    if_data = [if_data]
-                
                 # Get XCP_ON_CAN section and extract relevant information
-                xcp = next((entry for entry in if_data if "XCP_ON_CAN" in entry), None)
+                xcp = self.classify_if_data(ast)["xcp_on_can"]
                 if xcp is None:
                     raise Exception("XCP_ON_CAN section not found in A2L file")
                     
                 xcp_on_can = xcp["XCP_ON_CAN"]
-                a2l_params["CAN_ID_MASTER"], a2l_params["CAN_ID_MASTER_EXTENDED"] = self.extract_can_id(self.get_next_value(xcp_on_can["DataParams"], "CAN_ID_MASTER"))
-                a2l_params["CAN_ID_SLAVE"], a2l_params["CAN_ID_SLAVE_EXTENDED"] = self.extract_can_id(self.get_next_value(xcp_on_can["DataParams"], "CAN_ID_SLAVE"))
+                xcp_on_can_values = self.get_key_value_map(xcp_on_can["DataParams"])
+                a2l_params["CAN_ID_MASTER"], a2l_params["CAN_ID_MASTER_EXTENDED"] = self.extract_can_id(xcp_on_can_values.get("CAN_ID_MASTER"))
+                a2l_params["CAN_ID_SLAVE"], a2l_params["CAN_ID_SLAVE_EXTENDED"] = self.extract_can_id(xcp_on_can_values.get("CAN_ID_SLAVE"))
                 a2l_params["VERSION"] = xcp_on_can["DataParams"][0]
-                a2l_params["BAUDRATE"] = self.force_int(self.get_next_value(xcp_on_can["DataParams"], "BAUDRATE"))
+                a2l_params["BAUDRATE"] = self.force_int(xcp_on_can_values.get("BAUDRATE"))
                 
                 # Check for MAX_DLC_REQUIRED flag in XCP_ON_CAN DataParams
                 if "MAX_DLC_REQUIRED" in xcp_on_can["DataParams"]:
@@ -255,7 +440,7 @@ class CANedgeDAQ:
                     protocol_layer = xcp_on_can["PROTOCOL_LAYER"]["DataParams"]
                 except:
                     protocol_layer = xcp["PROTOCOL_LAYER"]["DataParams"]
-                    print("WARNING: Unable to extract PROTOCOL_LAYER from XCP_ON_CAN - extracting instead from general XCP settings")
+                    logger.warning("Unable to extract PROTOCOL_LAYER from XCP_ON_CAN - extracting instead from general XCP settings")
                     with open('a2L-troubleshooting.json', 'w') as f:
                         json.dump(xcp, f, indent=4)
                     
@@ -263,7 +448,7 @@ class CANedgeDAQ:
                     events = xcp_on_can["DAQ"]["EVENT"] 
                 except: 
                     events = xcp["DAQ"]["EVENT"] 
-                    print("WARNING: Unable to extract EVENT from XCP_ON_CAN - extracting instead from general XCP settings")
+                    logger.warning("Unable to extract EVENT from XCP_ON_CAN - extracting instead from general XCP settings")
                     with open('a2L-troubleshooting.json', 'w') as f:
                         json.dump(xcp, f, indent=4)
 
@@ -301,33 +486,31 @@ class CANedgeDAQ:
                 else:
                     a2l_params["MAX_DTO"] = "0x0040"
                                     
-            return a2l_params
+            return self.add_numeric_params(a2l_params)
             
         except Exception as e:
             # If there's an error extracting from A2L, load from default JSON file
             if self.default_params_file is None or not os.path.exists(self.default_params_file):
-                print(f"\nERROR: Failed to extract a2l_params from A2L: {str(e)}")
-                print("ERROR: No default params file provided or file does not exist.")
+                logger.error("Failed to extract a2l_params from A2L: %s", e)
+                logger.error("No default params file provided or file does not exist")
                 sys.exit(1)
                 
             try:
-                print(f"\nWARNING: Failed to extract a2l_params from A2L: {str(e)}")
-                print(f"WARNING: Loading default parameters from {self.default_params_file}")
-                print("WARNING: Please review the default parameters to ensure they are valid for your ECU!")
+                logger.warning("Failed to extract a2l_params from A2L: %s", e)
+                logger.warning("Loading default parameters from %s", self.default_params_file)
+                logger.warning("Please review the default parameters to ensure they are valid for your ECU!")
                 
-                with open(self.default_params_file, 'r') as f:
-                    a2l_params = json.load(f)
-                return a2l_params
+                a2l_params = load_json(self.default_params_file)
+                return self.add_numeric_params(a2l_params)
                 
             except Exception as json_e:
-                print(f"ERROR: Failed to load default parameters: {str(json_e)}")
+                logger.error("Failed to load default parameters: %s", json_e)
                 sys.exit(1)
     
     # ----------------------------------
-    # function for loading all computation methods from A2L files
+    # function for loading all computation methods from A2L files (returned as a lookup keyed by method name)
     def load_a2l_compu_methods(self, a2l_dict):
-        import json, sys 
-        signal_scaling = []
+        signal_scaling = {}  # computation methods keyed by name (later definitions override earlier ones)
         
         for a2l_file_name, ast in a2l_dict.items():
             compu_methods = ast.find_sections("COMPU_METHOD")["COMPU_METHOD"]
@@ -349,12 +532,12 @@ class CANedgeDAQ:
                     # Ensure offset is 0 instead of -0.0
                     offset = 0 if offset == -0.0 or offset == 0.0 else offset
                     
-                    signal_scaling.append({
+                    signal_scaling[method["Name"]] = {
                         "Name": method["Name"],
                         "Unit": unit,
                         "Scale": self.format_number(scale),
                         "Offset": self.format_number(offset)
-                    })
+                    }
                 
                 elif conversion_type == "RAT_FUNC":
                     coeffs = method.get("COEFFS", {})
@@ -369,75 +552,57 @@ class CANedgeDAQ:
                         # Ensure offset is 0 instead of -0.0
                         offset = 0 if offset == -0.0 or offset == 0.0 else offset
                         
-                        signal_scaling.append({
+                        signal_scaling[method["Name"]] = {
                             "Name": method["Name"],
                             "Unit": unit,
                             "Scale": self.format_number(scale),
                             "Offset": self.format_number(offset)
-                        })
+                        }
         
         return signal_scaling
             
     # ----------------------------------
     # Helper function to expand a matrix signal into individual signals with incremented addresses
     def expand_matrix_signal(self, signal):
-        import re
-        
         matrix_dim = int(signal.get("MatrixDim", 0))
         if matrix_dim <= 0:
             return [signal]  # Return original signal if no matrix dimension
             
-        expanded_signals = []
         base_name = signal.get("Name", "")
         ecu_addr_str = signal.get("ECU_ADDRESS", "")
         
         # Skip if no ECU address
         if not ecu_addr_str:
-            print(f"Warning: Matrix signal {base_name} has no ECU_ADDRESS, skipping expansion")
+            logger.warning("Matrix signal %s has no ECU_ADDRESS, skipping expansion", base_name)
             return [signal]
             
         # Convert ECU address to integer
         try:
             ecu_addr = int(ecu_addr_str.replace("0x", ""), 16)
         except (ValueError, TypeError):
-            print(f"Warning: Invalid ECU_ADDRESS for {base_name}: {ecu_addr_str}")
+            logger.warning("Invalid ECU_ADDRESS for %s: %s", base_name, ecu_addr_str)
             return [signal]
         
         # Get signal byte length
         signal_length = signal.get("Length", 0)
         
+        # Shared template without MATRIX_DIM (expanded elements only override name/address/index)
+        template = {key: value for key, value in signal.items() if key != "MATRIX_DIM"}
+        
         # Create individual signals for each matrix element
-        for i in range(matrix_dim):
-            expanded_signal = signal.copy()
-            
-            # Update name with matrix index suffix
-            expanded_signal["Name"] = f"{base_name}_MX_{i}"
-            
-            # Update ECU address for this element
-            new_addr = ecu_addr + (i * signal_length)
-            expanded_signal["ECU_ADDRESS"] = f"0x{new_addr:X}"
-            
-            # Add matrix index for reference
-            expanded_signal["MATRIX_INDEX"] = i
-            
-            # Remove the MATRIX_DIM entry as it's now expanded
-            if "MATRIX_DIM" in expanded_signal:
-                del expanded_signal["MATRIX_DIM"]
-                
-            expanded_signals.append(expanded_signal)
+        expanded_signals = [
+            {**template, "Name": f"{base_name}_MX_{i}", "ECU_ADDRESS": f"0x{ecu_addr + i * signal_length:X}", "MATRIX_INDEX": i}
+            for i in range(matrix_dim)
+        ]
         
         return expanded_signals
 
     # function for loading all signals from multiple A2L files
     def load_a2l_signals(self, a2l_dict, a2l_compu_methods):     
-        import json   
         signals = {}
         
-        # Create a lookup dictionary for computation methods
-        compu_methods_lookup = {method["Name"]: method for method in a2l_compu_methods}
-        
         for a2l_file_name, ast in a2l_dict.items():
-            print(f"A2L file: {a2l_file_name} | Project: {ast['PROJECT']['Name']} | Module: {ast['PROJECT']['MODULE']['Name']}")
+            logger.info("A2L file: %s | Project: %s | Module: %s", a2l_file_name, ast['PROJECT']['Name'], ast['PROJECT']['MODULE']['Name'])
             
             signals_partial = ast.find_sections("MEASUREMENT")["MEASUREMENT"]
             
@@ -452,9 +617,9 @@ class CANedgeDAQ:
             dt = signal.get("Datatype", "").strip().lower()
             signage, length = self.data_type_map.get(dt, ("unknown", 0))
             
-            # Extract matrix dimension
-            matrix_dim_list = signal.get("MATRIX_DIM", "")
-            matrix_dim = int(matrix_dim_list[0]) if matrix_dim_list != "" else 0
+            # Extract matrix dimension (first MATRIX_DIM value, 0 if absent or empty)
+            matrix_dim_list = signal.get("MATRIX_DIM")
+            matrix_dim = int(matrix_dim_list[0]) if matrix_dim_list else 0
             
             # Create new signal with all necessary attributes
             new_signal = {}
@@ -467,7 +632,7 @@ class CANedgeDAQ:
             new_signal["MatrixDim"] = matrix_dim
             
             # Lookup computation method using CONVERSION value
-            compu_method = compu_methods_lookup.get(signal.get("CONVERSION", ""))
+            compu_method = a2l_compu_methods.get(signal.get("CONVERSION", ""))
             if compu_method:
                 new_signal["Scale"] = compu_method["Scale"]
                 new_signal["Offset"] = compu_method["Offset"]
@@ -489,24 +654,27 @@ class CANedgeDAQ:
     # ----------------------------------
     # function for loading file with filtered signals provided by user
     def load_signal_file(self):
-        import csv
-        import sys
-
-        # Ensure the file exists
-        if not self.signal_file.exists():
-            print(f"Error: Signal file {self.signal_file} not found.")
-            sys.exit()
 
         csv_mapping = {}
         
-        # Read CSV file
-        with self.signal_file.open(newline='', encoding='utf-8') as csvfile:
-            reader = csv.reader(csvfile, delimiter=";")
-            for row in reader:
-                if len(row) < 2 or not row[0].strip():  # Skip empty rows
-                    continue
-                name, event = row[0].strip(), row[1].strip()
-                csv_mapping[name] = event  # Store event as a string
+        # Read CSV file (reading it directly doubles as the existence check, avoiding a separate stat call)
+        try:
+            with self.signal_file.open(newline='', encoding='utf-8') as signal_file:
+                text = signal_file.read()
+        except FileNotFoundError:
+            logger.error("Signal file %s not found", self.signal_file)
+            sys.exit()
+
+        # Plain "name;event" lines are split directly - quoted fields require the csv module
+        if '"' in text:
+            rows = csv.reader(io.StringIO(text, newline=''), delimiter=";")
+        else:
+            rows = (line.rstrip("\r").split(";", 2) for line in text.split("\n"))
+
+        for row in rows:
+            if len(row) < 2 or not row[0].strip():  # Skip empty rows
+                continue
+            csv_mapping[row[0].strip()] = row[1].strip()  # Store event as a string
 
         return csv_mapping
 
@@ -515,71 +683,41 @@ class CANedgeDAQ:
     # ----------------------------------
     # function for filtering A2L signals based on filter list (and adding event ID as EventConfigured)
     def filter_a2l_signals(self,a2l_signals_all, user_signals, a2l_params):  
-        import json
-        import re
-        
         # Clear previously matched signals
         self.matched_signals = set()
         
-        max_dto = min(int(a2l_params["MAX_DTO"], 16),64)
+        max_dto = min(a2l_params["MAX_DTO_INT"],64)
         signals_filtered_dict = {}
         
-        # Compile a regex pattern for matching matrix signals
-        # Pattern matches base_name_MX_index format
-        matrix_pattern = re.compile(r"(.+)_MX_([0-9]+)$")
-        
-        # First pass: build a mapping of base names to matrix signals
-        matrix_signals = {}
-        for signal in a2l_signals_all:
-            signal_name = signal.get("Name", "").strip()
-            matrix_match = matrix_pattern.match(signal_name)
-            
-            if matrix_match:
-                base_name = matrix_match.group(1)
-                if base_name not in matrix_signals:
-                    matrix_signals[base_name] = []
-                matrix_signals[base_name].append(signal)
-        
-        # Second pass: process all signals including matrix matches
+        # Single pass over all signals, matching either the signal name or (for matrix signals) its base name
         for signal in a2l_signals_all:
             signal_name = signal.get("Name", "").strip()
             
-            # Check for direct match
-            direct_match = signal_name in user_signals
+            # Check for direct match (user_signals is a dict, so each lookup is O(1))
+            event_config = user_signals.get(signal_name)
+            direct_match = event_config is not None
             # Check for matrix match (if signal is part of a matrix)
-            matrix_match = matrix_pattern.match(signal_name)
+            base_name = matrix_base_name(signal_name)
             base_name_match = False
             
-            if matrix_match:
-                base_name = matrix_match.group(1)
-                base_name_match = base_name in user_signals
+            if base_name is not None:
+                base_event_config = user_signals.get(base_name)
+                base_name_match = base_event_config is not None
+                if not direct_match:
+                    event_config = base_event_config
             
             if direct_match or base_name_match:
-                event_config = None
-                
-                # Determine which event configuration to use
-                if direct_match:
-                    event_config = user_signals[signal_name]
-                elif base_name_match:
-                    event_config = user_signals[base_name]
-                
-                if signal_name not in signals_filtered_dict and event_config is not None:
-                    # Create a new dictionary with "Name" and "EventConfigured" first
-                    new_signal = {}
+                if signal_name not in signals_filtered_dict:
+                    # Create a new dictionary with "Name" and "EventConfigured" first, followed by all other key/value pairs from the original signal
+                    new_signal = {"Name": signal_name, "EventConfigured": event_config, **signal}
                     new_signal["Name"] = signal_name
-                    new_signal["EventConfigured"] = event_config
-                    
-                    # Add all other key/value pairs from the original signal
-                    for key, value in signal.items():
-                        if key != "Name":
-                            new_signal[key] = value
                     
                     # Validation checks
                     if new_signal.get("Length", 0) == 0:
-                        print(f"Warning: Removed {signal_name} (length of 0)")
+                        logger.warning("Removed %s (length of 0)", signal_name)
                         continue
                     if new_signal.get("Length", 0) == 8 and max_dto == 8:
-                        print(f"Warning: Removed {signal_name} (length of 8) as MAX_DTO is 8 i.e. MAX_ODT_ENTRY_SIZE_DAQ = 7")
+                        logger.warning("Removed %s (length of 8) as MAX_DTO is 8 i.e. MAX_ODT_ENTRY_SIZE_DAQ = 7", signal_name)
                         continue
                     
                     signals_filtered_dict[signal_name] = new_signal
@@ -587,7 +725,7 @@ class CANedgeDAQ:
                     self.matched_signals.add(signal_name)
                     
                     # If this is a matrix signal, also add its base name to matched signals for reporting
-                    if matrix_match and base_name_match:
+                    if base_name_match:
                         self.matched_signals.add(base_name)
 
         signals_filtered = list(signals_filtered_dict.values())       
@@ -597,14 +735,12 @@ class CANedgeDAQ:
     # ----------------------------------
     # function for grouping filtered signals into DAQ and ODT lists
     def group_signals(self, signals, a2l_params, protocol):
-        from collections import defaultdict
-        import sys, json
         
         if len(signals) == 0:
-            print("No matched signals - exiting script!")
+            logger.error("No matched signals - exiting script!")
             sys.exit()
 
-        max_dto = min(int(a2l_params["MAX_DTO"], 16),64) # cannot be more than 64 bytes for CAN FD
+        max_dto = min(a2l_params["MAX_DTO_INT"],64) # cannot be more than 64 bytes for CAN FD
         max_payload = max_dto - 1  # Account for the 1-byte PID
         
         # Group signals by EVENT_CHANNEL_NUMBER (using EventConfigured value)
@@ -614,13 +750,16 @@ class CANedgeDAQ:
             daq_lists[event_channel].append(signal)
         
         signals_grouped = []
+        daq_odt_counts = {}  # Number of ODTs used per DAQ list
         daq_counter = 0
         
         # Assign DAQ lists and ODTs
         for event_channel, event_signals in daq_lists.items():
             odt_counter = 0
             current_odt_size = 0
-            odt_entries = []
+            odt_entry_number = 0
+            daq_list_number = f"0x{daq_counter:04X}"
+            odt_number = _HEX_LABELS_1B[0]
             
             for signal in event_signals:
                 signal_length = signal['Length']
@@ -629,60 +768,65 @@ class CANedgeDAQ:
                 if current_odt_size + signal_length > max_payload:
                     odt_counter += 1
                     current_odt_size = 0
-                    odt_entries = []
+                    odt_entry_number = 0
+                    odt_number = _HEX_LABELS_1B[odt_counter] if odt_counter < 256 else f"0x{odt_counter:02X}"
                     
                 # Assign DAQ, ODT, and ODT_ENTRY_NUMBER
-                odt_entry_number = len(odt_entries)
-                
-                signal['DAQ_LIST_NUMBER'] = f"0x{daq_counter:04X}"
-                signal['ODT_NUMBER'] = f"0x{odt_counter:02X}"
-                signal['ODT_ENTRY_NUMBER'] = f"0x{odt_entry_number:02X}"
+                signal['DAQ_LIST_NUMBER'] = daq_list_number
+                signal['ODT_NUMBER'] = odt_number
+                signal['ODT_ENTRY_NUMBER'] = _HEX_LABELS_1B[odt_entry_number] if odt_entry_number < 256 else f"0x{odt_entry_number:02X}"
                 
-                odt_entries.append(signal)
+                odt_entry_number += 1
                 current_odt_size += signal_length
-                signals_grouped.append(signal)
             
+            signals_grouped.extend(event_signals)
+            
+            # ODT 0 stays unused if the first signal already exceeds the max payload
+            daq_odt_counts[daq_list_number] = odt_counter + (event_signals[0]['Length'] <= max_payload)
             daq_counter += 1
         
         # For CCP protocol, verify ODT count doesn't exceed DAQ list capacity
         if protocol == "ccp" and "DAQ_LISTS" in a2l_params:
-            # Count ODTs per DAQ list
-            daq_odt_counts = {}
-            for signal in signals_grouped:
-                daq_id = signal['DAQ_LIST_NUMBER']
-                odt_id = signal['ODT_NUMBER']
-                if daq_id not in daq_odt_counts:
-                    daq_odt_counts[daq_id] = set()
-                daq_odt_counts[daq_id].add(odt_id)
-            
             # Check against DAQ_LISTS limits
-            for daq_id, odt_set in daq_odt_counts.items():
-                odt_count = len(odt_set)
+            for daq_id, odt_count in daq_odt_counts.items():
                 
                 # Find corresponding DAQ list entry
-                daq_list_entry = next((dl for dl in a2l_params['DAQ_LISTS'] if dl['Id'] == daq_id), None)
+                daq_list_entry = a2l_params['DAQ_LISTS_BY_ID'].get(daq_id)
                 if daq_list_entry:
                     max_odts = int(daq_list_entry['Length'], 16)
                     if odt_count > max_odts:
-                        print(f"\nERROR: DAQ list {daq_id} exceeds maximum ODT capacity!")
-                        print(f"  Assigned ODTs: {odt_count}")
-                        print(f"  Maximum ODTs: {max_odts} (0x{max_odts:02X})")
-                        print(f"\nPlease update your measurement file to split measurements across more DAQ lists.")
-                        print(f"Ensure signals using this event channel are distributed appropriately.")
+                        logger.error("DAQ list %s exceeds maximum ODT capacity!", daq_id)
+                        logger.error("  Assigned ODTs: %s", odt_count)
+                        logger.error("  Maximum ODTs: %s (0x%02X)", max_odts, max_odts)
+                        logger.error("Please update your measurement file to split measurements across more DAQ lists.")
+                        logger.error("Ensure signals using this event channel are distributed appropriately.")
                         sys.exit(1)
         
         return signals_grouped
 
 
 
+    # ----------------------------------
+    # helper function for indexing grouped signals by DAQ list and ODT (both sorted, signals kept in grouped order with parsed address/entry ints)
+    def index_signals(self, signals_grouped):
+        signal_index = defaultdict(lambda: defaultdict(list))
+        for signal in signals_grouped:
+            # Parse the hex fields used by the frame builders once per signal (into a copy, the caller's signals are not modified)
+            signal_index[signal['DAQ_LIST_NUMBER']][signal['ODT_NUMBER']].append({
+                **signal,
+                'ECU_ADDRESS_INT': int(signal['ECU_ADDRESS'], 16),
+                'ODT_ENTRY_INT': int(signal['ODT_ENTRY_NUMBER'], 16),
+            })
+        return {daq_list: {odt: odt_index[odt] for odt in sorted(odt_index)} for daq_list, odt_index in sorted(signal_index.items())}
+
     # ----------------------------------
     # function for creating the actual DAQ initialization CAN frames
     def create_daq_frames_ccp(self, signals_grouped, a2l_params, settings):
         daq_frames = []
         byte_order = a2l_params['BYTE_ORDER'] 
-        max_cto = min(int(a2l_params['MAX_CTO'], 16),8)
-        can_id_dto = int(a2l_params['CAN_ID_DTO'],16)
-        daq_lists = a2l_params['DAQ_LISTS']
+        bo = ">" if byte_order == "big" else "<"  # struct byte order prefix
+        max_cto = min(a2l_params['MAX_CTO_INT'],8)
+        can_id_dto = a2l_params['CAN_ID_DTO']
         bytes_only = a2l_params['BYTES_ONLY']
         
         # Convert to 32-bit format for extended IDs (set bit 31 to indicate extended)
@@ -694,94 +838,86 @@ class CANedgeDAQ:
         max_payload_size = 8 - 1  # Max CAN frame size minus 1 byte for command ID
         
         # Hardcoded values
-        address_extension = "00"
-        prescaler = "01"
-        start_stop_mode = "02"
-        bit_offset = "FF"
-        dummy_byte = "00"
+        address_extension = 0x00
+        start_stop_mode = 0x02
+        event_scaler = b"\x00\x01"  # Default prescaler of 1 
 
         # Counter initialization
         ctr = 1
         
         # CONNECT (using ECU station address in INTEL byte order)
-        daq_frames.append({"Name": "CONNECT", "DATA": f"01{ctr_hex(ctr)}{int(ecu_station_address,16).to_bytes(2, 'little').hex().upper()}AAAAAAAA"})
+        daq_frames.append({"Name": "CONNECT", "DATA": ccp_frame(0x01, ctr, int(ecu_station_address,16).to_bytes(2, 'little'))})
         ctr += 1
 
         # EXCHANGE_ID (to e.g. determine if seed & key is required)
-        daq_frames.append({"Name": "EXCHANGE_ID", "DATA": f"17{ctr_hex(ctr)}AAAAAAAAAAAA"})
+        daq_frames.append({"Name": "EXCHANGE_ID", "DATA": ccp_frame(0x17, ctr)})
         ctr += 1
 
-        # Get all relevant DAQ lists 
-        daq_lists = sorted(set(signal['DAQ_LIST_NUMBER'] for signal in signals_grouped))
+        # Get all relevant DAQ lists and their ODTs (with the integer value of each DAQ/ODT number parsed once)
+        signal_index = self.index_signals(signals_grouped)
+        label_ints = {label: int(label, 16) for daq_list, odt_index in signal_index.items() for label in (daq_list, *odt_index)}
 
         # Loop through GET_DAQ_SIZE + SET_DAQ_PTR + WRITE_DAQ
-        for daq_list in daq_lists:
-            daq_signals = [s for s in signals_grouped if s['DAQ_LIST_NUMBER'] == daq_list]
-            odts = sorted(set(s['ODT_NUMBER'] for s in daq_signals))
+        for daq_list, odt_index in signal_index.items():
 
             # GET_DAQ_SIZE (clear the DAQ list before writing elements)
-            daq_number = int(daq_list, 16).to_bytes(1, 'big').hex().upper()
-            daq_frames.append({"Name": f"GET_DAQ_SIZE_{daq_number}", "DATA": f"14{ctr_hex(ctr)}{daq_number}AA{can_id_dto.to_bytes(4,'big').hex().upper()}"})      
+            daq_int = label_ints[daq_list]
+            daq_number = _HEX_1B[daq_int]
+            daq_frames.append({"Name": f"GET_DAQ_SIZE_{daq_number}", "DATA": ccp_frame(0x14, ctr, bytes((daq_int, 0xAA)) + can_id_dto.to_bytes(4,'big'))})      
             ctr += 1
 
-            for odt in odts:
-                odt_signals = [s for s in daq_signals if s['ODT_NUMBER'] == odt]
-                odt_number = int(odt, 16).to_bytes(1, 'big').hex().upper() 
+            for odt, odt_signals in odt_index.items():
+                odt_int = label_ints[odt]
+                odt_number = _HEX_1B[odt_int]
               
                 # if the ECU supports multi-byte signals, handle the writing in the normal way
                 if bytes_only == False:
                     for idx, signal in enumerate(odt_signals):
-                        length = int(signal['Length']) 
-                        odt_entry = int(signal['ODT_ENTRY_NUMBER'], 16).to_bytes(1, 'big').hex().upper()
+                        length = signal['Length']
+                        odt_entry_int = signal['ODT_ENTRY_INT']
 
                         # SET_DAQ_PTR (for the DAQ, ODT and ODT element)
-                        daq_frames.append({"Name": f"PTR_D{daq_number}_O{odt_number}_E{odt_entry}", "DATA": f"15{ctr_hex(ctr)}{daq_number}{odt_number}{odt_entry}AAAAAA"})
+                        daq_frames.append({"Name": f"PTR_D{daq_number}_O{odt_number}_E{_HEX_1B[odt_entry_int]}", "DATA": ccp_frame(0x15, ctr, bytes((daq_int, odt_int, odt_entry_int)))})
                         ctr += 1
                         
                         # WRITE_DAQ (write a multi-element ECU address)
-                        ecu_address = int(signal['ECU_ADDRESS'], 16).to_bytes(4, byte_order).hex().upper()
-                        daq_frames.append({"Name": f"WRITE_DAQ", "DATA": f"16{ctr_hex(ctr)}{length:02X}{address_extension}{ecu_address}"})
+                        ecu_address = signal['ECU_ADDRESS_INT'].to_bytes(4, byte_order)
+                        daq_frames.append({"Name": f"WRITE_DAQ", "DATA": ccp_frame(0x16, ctr, bytes((length, address_extension)) + ecu_address)})
                         ctr += 1
                 elif bytes_only == True:
                     odt_entry_manual = 0 
                     for idx, signal in enumerate(odt_signals):
-                        length = int(signal['Length'])                     
+                        # Encode the ECU address of every byte in the signal in one pack call
+                        length = signal['Length']
+                        ecu_address_base = signal['ECU_ADDRESS_INT']
+                        ecu_addresses = struct.pack(f"{bo}{length}I", *range(ecu_address_base, ecu_address_base + length))
                         for signal_chunk_idx in range(length):
-                            odt_entry = odt_entry_manual.to_bytes(1, 'big').hex().upper()
-
                             # SET_DAQ_PTR (for the DAQ, ODT and ODT element)
-                            daq_frames.append({"Name": f"PTR_D{daq_number}_O{odt_number}_E{odt_entry}", "DATA": f"15{ctr_hex(ctr)}{daq_number}{odt_number}{odt_entry}AAAAAA"})
+                            daq_frames.append({"Name": f"PTR_D{daq_number}_O{odt_number}_E{_HEX_1B[odt_entry_manual]}", "DATA": ccp_frame(0x15, ctr, bytes((daq_int, odt_int, odt_entry_manual)))})
                             ctr += 1
                             odt_entry_manual += 1
                             
                             # WRITE_DAQ (write a multi-element ECU address one byte at a time)
-                            ecu_address_base = int(signal['ECU_ADDRESS'], 16)
-                            ecu_address_with_offset = (ecu_address_base + signal_chunk_idx).to_bytes(4, byte_order).hex().upper()
+                            ecu_address_with_offset = ecu_addresses[4 * signal_chunk_idx:4 * signal_chunk_idx + 4]
                     
-                            daq_frames.append({"Name": f"WRITE_DAQ", "DATA": f"16{ctr_hex(ctr)}01{address_extension}{ecu_address_with_offset}"})
+                            daq_frames.append({"Name": f"WRITE_DAQ", "DATA": ccp_frame(0x16, ctr, bytes((0x01, address_extension)) + ecu_address_with_offset)})
                             ctr += 1
 
              
 
         # START_STOP_DAQ_LIST (prepare all relevant DAQ lists)
-        for daq_list in daq_lists:
-            daq_signals = [s for s in signals_grouped if s['DAQ_LIST_NUMBER'] == daq_list]
-            odts = sorted(set(s['ODT_NUMBER'] for s in daq_signals))
-
-            event_channel = int(next(s for s in signals_grouped if s['DAQ_LIST_NUMBER'] == daq_list)['EventConfigured'], 16)
-            event_channel_hex = event_channel.to_bytes(1, byte_order).hex().upper()
-            event_scaler_hex = "0001"  # Default prescaler of 1 
-
-            # loop through ODTs in the DAQ list to get the last ODT number
-            for odt in odts:
-                daq_number = int(daq_list, 16).to_bytes(1, 'big').hex().upper()
-                odt_number = int(odt, 16).to_bytes(1, 'big').hex().upper() 
+        for daq_list, odt_index in signal_index.items():
+            event_channel = int(next(iter(odt_index.values()))[0]['EventConfigured'], 16)
+
+            # use the last ODT number in the DAQ list
+            daq_int = label_ints[daq_list]
+            odt_int = label_ints[next(reversed(odt_index))]
                             
-            daq_frames.append({"Name": f"START_STOP_D{daq_number}", "DATA": f"06{ctr_hex(ctr)}{start_stop_mode}{daq_number}{odt_number}{event_channel_hex}{event_scaler_hex}"})
+            daq_frames.append({"Name": f"START_STOP_D{_HEX_1B[daq_int]}", "DATA": ccp_frame(0x06, ctr, bytes((start_stop_mode, daq_int, odt_int, event_channel)) + event_scaler)})
             ctr += 1
         
         # START_STOP_ALL (initiate DAQ-DTO communication)
-        daq_frames.append({"Name": f"START_STOP_ALL", "DATA": f"08{ctr_hex(ctr)}01AAAAAAAAAA"})
+        daq_frames.append({"Name": f"START_STOP_ALL", "DATA": ccp_frame(0x08, ctr, b"\x01")})
         ctr += 1
 
         # print("daq_frames",json.dumps(daq_frames,indent=4))
@@ -793,19 +929,23 @@ class CANedgeDAQ:
     def create_daq_frames_xcp(self, signals_grouped, a2l_params, settings):
         daq_frames = []
         byte_order = a2l_params['BYTE_ORDER'] 
-        max_cto = min(int(a2l_params['MAX_CTO'], 16),64)
+        max_cto = min(a2l_params['MAX_CTO_INT'],64)
         max_payload_size = 64 - 1  # Max CAN FD frame size minus 1 byte for command ID
         max_dlc_required = a2l_params.get('MAX_DLC_REQUIRED', False)
         pack_consecutive_bytes = settings.get('pack_consecutive_bytes', False)
         
-        # Helper function to pad data to MAX_CTO if MAX_DLC_REQUIRED is True
+        # Helper function to pad data to MAX_CTO if MAX_DLC_REQUIRED is True (returns the frame data as a hex string)
         def pad_cto(data):
+            if max_dlc_required and len(data) < max_cto:
+                data = data.ljust(max_cto, b"\x00")
+            return data.hex().upper()
+        
+        # Helper function to finalize a WRITE_DAQ_MULTIPLE frame (padded to MAX_CTO if MAX_DLC_REQUIRED, else to the full 64 byte frame)
+        def write_daq_multi(frame):
             if max_dlc_required:
-                current_length = len(data) // 2  # Convert hex string to byte count
-                if current_length < max_cto:
-                    padding = "00" * (max_cto - current_length)
-                    return data + padding
-            return data
+                return pad_cto(frame)
+            frame.extend(bytes(64 - len(frame)))
+            return frame[:64].hex().upper()
         
         # Helper function to group consecutive signals for optimization
         def group_consecutive_signals(signals):
@@ -822,9 +962,9 @@ class CANedgeDAQ:
                 curr_signal = signals[i]
                 
                 # Check if signals are consecutive
-                prev_addr = int(prev_signal['ECU_ADDRESS'], 16)
-                curr_addr = int(curr_signal['ECU_ADDRESS'], 16)
-                prev_length = int(prev_signal['Length'])
+                prev_addr = prev_signal['ECU_ADDRESS_INT']
+                curr_addr = curr_signal['ECU_ADDRESS_INT']
+                prev_length = prev_signal['Length']
                 
                 # Check if address extension matches (using ADDRESS_EXTENSION if available)
                 prev_addr_ext = prev_signal.get('ADDRESS_EXTENSION', '0x00')
@@ -852,125 +992,101 @@ class CANedgeDAQ:
             return groups
         
         # Hardcoded values
-        address_extension = "00"
-        prescaler = "01"
-        start_stop_mode = "02"
-        bit_offset = "FF"
-        dummy_byte = "00"
+        address_extension = 0x00
+        prescaler = 0x01
+        start_stop_mode = 0x02
+        bit_offset = 0xFF
+        dummy_byte = 0x00
+        
+        # Frame layouts (multi-byte fields use the ECU byte order)
+        bo = ">" if byte_order == "big" else "<"
+        daq_cmd = struct.Struct(f"{bo}BBH")  # command, mode/reserved, DAQ list number
+        daq_odt_cmd = struct.Struct(f"{bo}BBHBB")  # command, reserved, DAQ list number, ODT number, value
+        write_daq = struct.Struct(f"{bo}BBBBI")  # WRITE_DAQ command, bit offset, size, address extension, address
+        daq_entry = struct.Struct(f"{bo}BBIBB")  # WRITE_DAQ_MULTIPLE element: bit offset, size, address, address extension, dummy byte
         
         # Generic initialization commands
-        daq_frames.append({"Name": "CONNECT", "DATA": pad_cto("FF00")})
-        daq_frames.append({"Name": "GET_STATUS", "DATA": pad_cto("FD")})
-        daq_frames.append({"Name": "FREE_DAQ", "DATA": pad_cto("D6")})
+        daq_frames.append({"Name": "CONNECT", "DATA": pad_cto(b"\xFF\x00")})
+        daq_frames.append({"Name": "GET_STATUS", "DATA": pad_cto(b"\xFD")})
+        daq_frames.append({"Name": "FREE_DAQ", "DATA": pad_cto(b"\xD6")})
         
         # AL_DAQ (0xD5 commands)
-        daq_lists = sorted(set(signal['DAQ_LIST_NUMBER'] for signal in signals_grouped))
-        daq_count = len(daq_lists).to_bytes(2, byte_order).hex().upper()
-        daq_frames.append({"Name": "AL_DAQ", "DATA": pad_cto(f"D500{daq_count}")})
+        signal_index = self.index_signals(signals_grouped)
+        label_ints = {label: int(label, 16) for daq_list, odt_index in signal_index.items() for label in (daq_list, *odt_index)}  # DAQ/ODT numbers parsed once
+        daq_frames.append({"Name": "AL_DAQ", "DATA": pad_cto(daq_cmd.pack(0xD5, 0x00, len(signal_index)))})
         
         # AL_ODT and AL_ODT_ENTRY (0xD4 commands)
-        for daq_list in daq_lists:
-            odts = sorted(set(signal['ODT_NUMBER'] for signal in signals_grouped if signal['DAQ_LIST_NUMBER'] == daq_list))
-            daq_number = int(daq_list, 16).to_bytes(2, byte_order).hex().upper()
-            
-            daq_frames.append({"Name": f"AL_ODT_{daq_list}", "DATA": pad_cto(f"D400{daq_number}{len(odts):02X}")})
+        for daq_list, odt_index in signal_index.items():
+            daq_frames.append({"Name": f"AL_ODT_{daq_list}", "DATA": pad_cto(daq_cmd.pack(0xD4, 0x00, label_ints[daq_list]) + bytes((len(odt_index),)))})
         
         # AL_ODT_ENTRY (0xD3 commands)
-        for daq_list in daq_lists:
-            odts = sorted(set(signal['ODT_NUMBER'] for signal in signals_grouped if signal['DAQ_LIST_NUMBER'] == daq_list))
-            daq_number = int(daq_list, 16).to_bytes(2, byte_order).hex().upper()
-            for odt in odts:
-                
-                entries = [signal for signal in signals_grouped if signal['DAQ_LIST_NUMBER'] == daq_list and signal['ODT_NUMBER'] == odt]
-                odt_number = int(odt, 16).to_bytes(1, 'big').hex().upper()
+        odt_groups = {}  # grouped ODT entries, reused for the WRITE_DAQ commands
+        for daq_list, odt_index in signal_index.items():
+            daq_int = label_ints[daq_list]
+            for odt, entries in odt_index.items():
                 
                 # Count actual ODT entries (grouped if consecutive packing is enabled)
-                grouped_entries = group_consecutive_signals(entries)
+                grouped_entries = odt_groups[(daq_list, odt)] = group_consecutive_signals(entries)
                 entry_count = len(grouped_entries)
                 
-                daq_frames.append({"Name": f"AL_ODT_ENT_{odt}", "DATA": pad_cto(f"D300{daq_number}{odt_number}{entry_count:02X}")})
+                daq_frames.append({"Name": f"AL_ODT_ENT_{odt}", "DATA": pad_cto(daq_odt_cmd.pack(0xD3, 0x00, daq_int, label_ints[odt], entry_count))})
         
         # SET_DAQ_PTR once per ODT, followed by multiple WRITE_DAQ or WRITE_DAQ_MULTIPLE commands
-        for daq_list in daq_lists:
-            daq_signals = [s for s in signals_grouped if s['DAQ_LIST_NUMBER'] == daq_list]
-            
-            odts = sorted(set(s['ODT_NUMBER'] for s in daq_signals))
-            for odt in odts:
-                odt_signals = [s for s in daq_signals if s['ODT_NUMBER'] == odt]
-                daq_number = int(daq_list, 16).to_bytes(2, byte_order).hex().upper()
-                odt_number = int(odt, 16).to_bytes(1, 'big').hex().upper()
-                
-                daq_frames.append({"Name": "SET_DAQ_PTR", "DATA": pad_cto(f"E200{daq_number}{odt_number}00")})
+        for daq_list, odt_index in signal_index.items():
+            daq_int = label_ints[daq_list]
+            for odt, odt_signals in odt_index.items():
+                daq_frames.append({"Name": "SET_DAQ_PTR", "DATA": pad_cto(daq_odt_cmd.pack(0xE2, 0x00, daq_int, label_ints[odt], 0x00))})
                 
                 if max_cto == 64:
-                    frame_data = []
+                    frame = bytearray(b"\xC7\x00")  # WRITE_DAQ_MULTIPLE command and entry count, followed by the DAQ entries
                     for signal in odt_signals:
-                        length = int(signal['Length'])  # Ensure length is a valid integer, default to 1
-                        ecu_address = int(signal['ECU_ADDRESS'], 16).to_bytes(4, byte_order).hex().upper()
-                        signal_entry = f"{bit_offset}{length:02X}{ecu_address}{address_extension}{dummy_byte}"
-                        
-                        if len("".join(frame_data) + signal_entry) // 2 > max_payload_size:
-                            data = f"C7{len(frame_data):02X}{''.join(frame_data)}"
-                            if max_dlc_required:
-                                data = pad_cto(data)
-                            else:
-                                data = data.ljust(128, '0')[:128]
-                            daq_frames.append({"Name": "WRITE_DAQ_MULTI", "DATA": data})
-                            frame_data = []
+                        if len(frame) - 2 + daq_entry.size > max_payload_size:
+                            daq_frames.append({"Name": "WRITE_DAQ_MULTI", "DATA": write_daq_multi(frame)})
+                            frame = bytearray(b"\xC7\x00")
                         
-                        frame_data.append(signal_entry)
+                        frame += daq_entry.pack(bit_offset, signal['Length'], signal['ECU_ADDRESS_INT'], address_extension, dummy_byte)
+                        frame[1] += 1
                     
-                    if frame_data:
-                        data = f"C7{len(frame_data):02X}{''.join(frame_data)}"
-                        if max_dlc_required:
-                            data = pad_cto(data)
-                        else:
-                            data = data.ljust(128, '0')[:128]
-                        daq_frames.append({"Name": "WRITE_DAQ_MULTI", "DATA": data})
+                    if frame[1]:
+                        daq_frames.append({"Name": "WRITE_DAQ_MULTI", "DATA": write_daq_multi(frame)})
                 else:
                     # Group consecutive signals if optimization is enabled
-                    signal_groups = group_consecutive_signals(odt_signals)
+                    signal_groups = odt_groups[(daq_list, odt)]
                     
                     entry_idx = 0
                     for group in signal_groups:
                         if len(group) == 1:
                             # Single signal - use original logic
                             signal = group[0]
-                            length = int(signal['Length']) 
-                            ecu_address = int(signal['ECU_ADDRESS'], 16).to_bytes(4, byte_order).hex().upper()                        
-                            daq_frames.append({"Name": f"WRITE_DAQ_0x{entry_idx:02X}", "DATA": pad_cto(f"E1FF{length:02X}{address_extension}{ecu_address}")})
+                            daq_frames.append({"Name": f"WRITE_DAQ_0x{entry_idx:02X}", "DATA": pad_cto(write_daq.pack(0xE1, bit_offset, signal['Length'], address_extension, signal['ECU_ADDRESS_INT']))})
                             entry_idx += 1
                         else:
                             # Multiple consecutive signals - combine into single WRITE_DAQ
                             first_signal = group[0]
-                            combined_length = sum(int(sig['Length']) for sig in group)
-                            ecu_address = int(first_signal['ECU_ADDRESS'], 16).to_bytes(4, byte_order).hex().upper()
-                            daq_frames.append({"Name": f"WRITE_DAQ_0x{entry_idx:02X}", "DATA": pad_cto(f"E1FF{combined_length:02X}{address_extension}{ecu_address}")})
+                            combined_length = sum(sig['Length'] for sig in group)
+                            daq_frames.append({"Name": f"WRITE_DAQ_0x{entry_idx:02X}", "DATA": pad_cto(write_daq.pack(0xE1, bit_offset, combined_length, address_extension, first_signal['ECU_ADDRESS_INT']))})
                             entry_idx += 1
 
         # SET_DAQ_LIST_MODE (now with correct priority lookup)
-        for daq_list in daq_lists:
-            event_channel = int(next(s for s in signals_grouped if s['DAQ_LIST_NUMBER'] == daq_list)['EventConfigured'], 16)
+        events_by_channel = {}  # first event definition per event channel
+        for event in a2l_params["EVENTS"]:
+            events_by_channel.setdefault(int(event["EventChannelNumber"]), event)
+        
+        for daq_list, odt_index in signal_index.items():
+            event_channel = int(next(iter(odt_index.values()))[0]['EventConfigured'], 16)
             
             # Lookup priority in a2l_params["EVENTS"]
-            event_priority = "00"  # Default
-            for event in a2l_params["EVENTS"]:
-                if int(event["EventChannelNumber"]) == event_channel:
-                    event_priority = event["EventPriority"].upper().replace("0X", "")
-                    break  # Stop searching once a match is found
+            event = events_by_channel.get(event_channel)
+            event_priority = int(event["EventPriority"], 16) if event else 0x00  # Default 0x00
             
-            daq_number = int(daq_list, 16).to_bytes(2, byte_order).hex().upper()
-            event_channel_hex = event_channel.to_bytes(2, byte_order).hex().upper()
-            
-            daq_frames.append({"Name": "SET_DAQ_LIST_MOD", "DATA": pad_cto(f"E000{daq_number}{event_channel_hex}{prescaler}{event_priority}")})
+            daq_frames.append({"Name": "SET_DAQ_LIST_MOD", "DATA": pad_cto(daq_cmd.pack(0xE0, 0x00, label_ints[daq_list]) + struct.pack(f"{bo}HBB", event_channel, prescaler, event_priority))})
 
         # START_STOP_DAQ_LIST
-        for daq_list in daq_lists:
-            daq_number = int(daq_list, 16).to_bytes(2, byte_order).hex().upper()
-            daq_frames.append({"Name": "START_STOP_DAQ", "DATA": pad_cto(f"DE{start_stop_mode}{daq_number}")})
+        for daq_list in signal_index:
+            daq_frames.append({"Name": "START_STOP_DAQ", "DATA": pad_cto(daq_cmd.pack(0xDE, start_stop_mode, label_ints[daq_list]))})
 
         # START_STOP_SYNC
-        daq_frames.append({"Name": "START_STOP_SYNCH", "DATA": pad_cto("DD01")})
+        daq_frames.append({"Name": "START_STOP_SYNCH", "DATA": pad_cto(b"\xDD\x01")})
         
         return daq_frames
 
@@ -980,7 +1096,6 @@ class CANedgeDAQ:
     # ----------------------------------
     # function for creating CANedge transmit list 
     def create_transmit_list(self, daq_frames, a2l_params, settings, output_transmit):
-        import json, sys
         
         transmit_list = []
         start_delay = settings['start_delay']
@@ -994,90 +1109,140 @@ class CANedgeDAQ:
             frame_format_default = 1
             brs = 1
         
-        can_id_master = a2l_params['CAN_ID_MASTER'].replace("0x", "").upper()
+        can_id_master = f"{a2l_params['CAN_ID_MASTER']:X}"
         id_format = 1 if a2l_params['CAN_ID_MASTER_EXTENDED'] else 0
         
+        # Fields shared by all frames (copied per frame, so the per-frame fields keep their position in the JSON output)
+        transmit_base = {
+            "name": None,
+            "state": 1,
+            "id_format": id_format,
+            "frame_format": frame_format_default,
+            "brs": brs,
+            "log": 1,
+            "period": 0,
+            "delay": None,
+            "id": can_id_master,
+            "data": None
+        }
+        
         delay = start_delay
         total_data_bytes = 0
         
         for frame in daq_frames:
-            frame_format = 1 if len(frame['DATA']) > 16 else frame_format_default # More than 8 bytes means CAN FD
-            frame_data_length = len(frame['DATA']) // 2  # Convert hex string length to bytes
+            frame_data = frame['DATA']
+            frame_data_length = len(frame_data) // 2  # Convert hex string length to bytes
             total_data_bytes += frame_data_length
             
-            transmit_list.append({
-                "name": frame["Name"],
-                "state": 1,
-                "id_format": id_format,
-                "frame_format": frame_format,
-                "brs": brs,
-                "log": 1,
-                "period": 0,
-                "delay": delay,
-                "id": can_id_master,
-                "data": frame["DATA"]
-            })
+            transmit_entry = transmit_base.copy()
+            transmit_entry["name"] = frame["Name"]
+            if frame_data_length > 8:  # More than 8 bytes means CAN FD
+                transmit_entry["frame_format"] = 1
+            transmit_entry["delay"] = delay
+            transmit_entry["data"] = frame_data
+            transmit_list.append(transmit_entry)
             
             delay += frame_spacing
         
         # Check for CANedge device limitations
         if len(transmit_list) > max_frames:
-            print(f"WARNING: Transmit list contains {len(transmit_list)} frames, exceeding the limit of {max_frames} frames  - exiting script!")
+            logger.error("Transmit list contains %s frames, exceeding the limit of %s frames - exiting script!", len(transmit_list), max_frames)
             sys.exit()
         
         if total_data_bytes > max_data_bytes:
-            print(f"WARNING: Total data bytes used: {total_data_bytes}, exceeding the limit of {max_data_bytes} bytes - exiting script!")
+            logger.error("Total data bytes used: %s, exceeding the limit of %s bytes - exiting script!", total_data_bytes, max_data_bytes)
             sys.exit()
                 
-        transmit_list_json = json.dumps({"can_1": {"transmit": transmit_list}}, indent=2)
+        transmit_data = {"can_1": {"transmit": transmit_list}}
+        if orjson is not None:
+            transmit_list_json = orjson.dumps(transmit_data, option=orjson.OPT_INDENT_2).decode("utf-8")
+        else:
+            transmit_list_json = json.dumps(transmit_data, indent=2)
         
-        # Save the transmit list JSON file
+        # Save the transmit list JSON file (text mode, so line endings follow the platform convention)
         output_transmit = output_transmit.with_suffix(".json")
         output_transmit.parent.mkdir(parents=True, exist_ok=True)
         with open(output_transmit, "w") as f:
             f.write(transmit_list_json)
 
         
-        print(f"Created CANedge transmit list JSON with {len(transmit_list)} frames: {output_transmit}")
+        logger.info("Created CANedge transmit list JSON with %s frames: %s", len(transmit_list), output_transmit)
         
         return transmit_list_json
 
     # ----------------------------------
     # function for creating a status CSV file showing matched vs unmatched signals
     def create_status_csv(self, user_signals):
-        import csv
-        from pathlib import Path
         
         # Create output path based on input file name
         input_path = Path(self.signal_file)
         status_path = input_path.parent / f"{input_path.stem}_status.csv"
         
-        # Prepare data rows - each row will have signal name and match status
-        rows = []
-        
-        # Add unmatched signals first
-        for signal_name in user_signals.keys():
-            if signal_name not in self.matched_signals:
-                rows.append([signal_name, user_signals[signal_name], "Not Matched"])
-        
-        # Then add matched signals
-        for signal_name in user_signals.keys():
-            if signal_name in self.matched_signals:
-                rows.append([signal_name, user_signals[signal_name], "Matched"])
+        # Prepare data rows - each row will have signal name and match status (header first, then unmatched, then matched signals)
+        rows = [["Signal Name", "Event Channel", "Match Status"]]
+        matched_rows = []
+        matched_signals = self.matched_signals  # set, so each membership test is O(1)
+        for signal_name, event in user_signals.items():
+            if signal_name in matched_signals:
+                matched_rows.append([signal_name, event, "Matched"])
+            else:
+                rows.append([signal_name, event, "Not Matched"])
+        rows += matched_rows
         
-        # Write to CSV file
-        with open(status_path, 'w', newline='', encoding='utf-8') as csvfile:
+        # Write to CSV file in a single buffered pass
+        with open(status_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
             writer = csv.writer(csvfile, delimiter=';')
-            writer.writerow(["Signal Name", "Event Channel", "Match Status"])  # Header
             writer.writerows(rows)
             
-        print(f"\nCreated status CSV file: {status_path}")
+        logger.info("Created status CSV file: %s", status_path)
         return status_path
         
+    # ----------------------------------
+    # function for mapping signal names to unique DBC signal names ("." replaced by "_" and optionally shortened to 32 chars)
+    def create_dbc_signal_names(self, signals_grouped, settings):
+        dbc_signal_names = {signal['Name']: signal['Name'].replace('.', '_') for signal in signals_grouped}
+        
+        if settings.get("shorten_signals", False):
+            # Count signals per 29 char base name - base names used by multiple signals get a _00, _01, ... suffix
+            base_name_counts = {}
+            for dbc_signal_name in dbc_signal_names.values():
+                base_name = dbc_signal_name[:29]
+                base_name_counts[base_name] = base_name_counts.get(base_name, 0) + 1
+
+            base_name_counters = {}
+            for original_signal_name, dbc_signal_name in dbc_signal_names.items():
+                base_name = dbc_signal_name[:29]
+                if base_name_counts[base_name] > 1:
+                    suffix = base_name_counters.get(base_name, 0)
+                    base_name_counters[base_name] = suffix + 1
+                    dbc_signal_names[original_signal_name] = f"{base_name}_{suffix:02d}"
+                else:
+                    dbc_signal_names[original_signal_name] = base_name
+
+        # Ensure uniqueness (e.g. "a.b" vs. "a_b" or a suffixed name equal to another signal name) via a short hash suffix
+        # (hashed names must not clash with any other resolved name, including names of signals that come later)
+        shorten_signals = settings.get("shorten_signals", False)
+        reserved_names = set(dbc_signal_names.values())
+        seen_names = set()
+        for original_signal_name, dbc_signal_name in dbc_signal_names.items():
+            if dbc_signal_name in seen_names:
+                base_name = dbc_signal_name[:27] if shorten_signals else dbc_signal_name
+                attempt = 0
+                while dbc_signal_name in seen_names or dbc_signal_name in reserved_names:
+                    hash_input = f"{original_signal_name}|{attempt}" if attempt else original_signal_name
+                    name_hash = hashlib.blake2s(hash_input.encode("utf-8"), digest_size=2).hexdigest().upper()
+                    dbc_signal_name = f"{base_name}_{name_hash}"
+                    attempt += 1
+                dbc_signal_names[original_signal_name] = dbc_signal_name
+                reserved_names.add(dbc_signal_name)
+            seen_names.add(dbc_signal_name)
+        
+        return dbc_signal_names
+        
     # ----------------------------------
     # function for creating DBC file from A2L signal information and DAQ frames
-    def create_dbc(self, signals_grouped, a2l_params, output_dbc, settings, protocol): 
-        dbc_content = [
+    def create_dbc(self, signals_grouped, a2l_params, output_dbc, settings, protocol, dbc_signal_names=None): 
+        dbc_header = [
             f'VERSION "{protocol.upper()}_DBC"\n',
             'NS_ :',
             '\tNS_DESC_', '\tCM_', '\tBA_DEF_', '\tBA_', '\tVAL_', '\tCAT_DEF_',
@@ -1090,7 +1255,11 @@ class CANedgeDAQ:
         ]
         
         byte_order_flag = '1' if a2l_params['BYTE_ORDER'] == 'little' else '0'
-        can_id_slave = int(a2l_params['CAN_ID_SLAVE'], 16)
+        
+        # DBC signal line template for the byte order (Intel start bits point to the LSB, Motorola to the MSB of the first byte)
+        signal_line_template = f'\n  SG_ {{name}} m{{pid}} : {{start_bit}}|{{bit_length}}@{byte_order_flag}{{sign}} ({{scale}},{{offset}}) [{{lower_limit}}|{{upper_limit}}] "{{unit}}"  Logger'
+        start_bit_offset = 0 if byte_order_flag == '1' else 7
+        can_id_slave = a2l_params['CAN_ID_SLAVE']
         
         # Convert to DBC 32-bit format for extended IDs (set bit 31 to indicate extended)
         if a2l_params['CAN_ID_SLAVE_EXTENDED'] == True:
@@ -1099,7 +1268,7 @@ class CANedgeDAQ:
         # Handle Classical vs. CAN FD fields
         dlc = 8
         bus_type = "CAN"
-        if int(a2l_params['MAX_CTO'], 16) > 8 or int(a2l_params['MAX_DTO'], 16) > 8: 
+        if a2l_params['MAX_CTO_INT'] > 8 or a2l_params['MAX_DTO_INT'] > 8: 
             dlc = 64 
             bus_type ="CAN FD"
         
@@ -1113,129 +1282,112 @@ class CANedgeDAQ:
             vframeformat = "ExtendedCAN_FD"            
         
         
-        # DTO Message Definition            
-        dbc_content.append(f'BO_ {can_id_slave} DTO: {dlc} Logger')
-        dbc_content.append('  SG_ DTOPID M : 0|8@1+ (1,0) [0|255] ""  Logger')
-
-        pid_counter = 0
-        signal_name_map = {}  # Track signal names for uniqueness
         signal_comments = []  # Store signal comments
         signal_floats = []    # Store signal float meta data
 
-        # Pre-scan all signals to identify base name conflicts if shortening is enabled
-        base_name_conflicts = {}  # Maps base_name -> list of full signal names
-        if settings.get("shorten_signals", False):
-            for signal in signals_grouped:
-                original_signal_name = signal['Name']
-                dbc_signal_name = original_signal_name.replace('.', '_')
-                base_name = dbc_signal_name[:29]
-                if base_name not in base_name_conflicts:
-                    base_name_conflicts[base_name] = []
-                base_name_conflicts[base_name].append(dbc_signal_name)
-        
-        # Identify which base names need suffixes (those with multiple signals)
-        base_names_needing_suffix = {base_name for base_name, names in base_name_conflicts.items() if len(names) > 1}
-        base_name_counters = {base_name: 0 for base_name in base_names_needing_suffix}
-
-        for daq_list in sorted(set(signal['DAQ_LIST_NUMBER'] for signal in signals_grouped)):
-
-            # For CCP, each DAQ list has a 'first PID' that we should start from when shifting to the DAQ list
-            if protocol == "ccp":
-                daq_list_entry = next((dl for dl in a2l_params['DAQ_LISTS'] if int(dl['Id'],16) == int(daq_list,16)), None)
-                if daq_list_entry:
-                    pid_counter = int(daq_list_entry['FirstPID'], 16)
+        # Resolve DBC signal names (unless already provided by the caller)
+        if dbc_signal_names is None:
+            dbc_signal_names = self.create_dbc_signal_names(signals_grouped, settings)
+
+        # Generator yielding the multiplexed DBC signal lines (newline-prefixed) while collecting their comments and float meta data
+        def signal_lines():
+            pid_counter = 0
+            # Sort once by DAQ list and ODT (stable, so signals keep their grouped order) and walk the groups in a single pass
+            signals_sorted = sorted(signals_grouped, key=itemgetter('DAQ_LIST_NUMBER', 'ODT_NUMBER'))
+            for daq_list, daq_signals in groupby(signals_sorted, key=itemgetter('DAQ_LIST_NUMBER')):
+
+                # For CCP, each DAQ list has a 'first PID' that we should start from when shifting to the DAQ list
+                if protocol == "ccp":
+                    daq_list_entry = a2l_params['DAQ_LISTS_BY_INT'].get(int(daq_list, 16))
+                    if daq_list_entry:
+                        pid_counter = int(daq_list_entry['FirstPID'], 16)
                 
-            odts = sorted(set(signal['ODT_NUMBER'] for signal in signals_grouped if signal['DAQ_LIST_NUMBER'] == daq_list))
-            for odt in odts:
-                odt_signals = [s for s in signals_grouped if s['DAQ_LIST_NUMBER'] == daq_list and s['ODT_NUMBER'] == odt]
-
-
-                bit_start = 8  # Start after PID (1st byte)
-                for signal in odt_signals:
-                    original_signal_name = signal['Name']
-                    dbc_signal_name = original_signal_name.replace('.', '_')  # Convert "." to "_" for DBC compatibility
-                    bit_length = signal['Length'] * 8
-                    sign = '+' if signal['Signage'] == 'unsigned' else '-'
-                    lower_limit = signal['LowerLimit']
-                    upper_limit = signal['UpperLimit']
-                    scale = signal['Scale']
-                    offset = signal['Offset']
-                    unit = signal['Unit']
-                    long_identifier = signal.get('LongIdentifier', '').strip('"')
-
-                    # Handle signal name shortening and uniqueness
-                    if settings.get("shorten_signals", False):
-                        base_name = dbc_signal_name[:29]  # First 29 characters
-                        if base_name in base_names_needing_suffix:
-                            # This base name has conflicts, so add suffix starting from _00
-                            suffix = base_name_counters[base_name]
-                            new_signal_name = f"{base_name}_{suffix:02d}"
-                            base_name_counters[base_name] += 1
-                        else:
-                            # No conflicts, use base name directly
-                            new_signal_name = base_name
-                        signal_name_map[new_signal_name] = dbc_signal_name
-                    else:
-                        new_signal_name = dbc_signal_name
-
-                    if byte_order_flag == '0': 
-                        dbc_start_bit = bit_start + 7  # Point to MSB of the first byte
-                    else:  
-                        dbc_start_bit = bit_start  # Point to LSB of the first byte
-
-                    dbc_content.append(
-                        f'  SG_ {new_signal_name} m{pid_counter} : {dbc_start_bit}|{bit_length}@{byte_order_flag}{sign} ({scale},{offset}) [{lower_limit}|{upper_limit}] "{unit}"  Logger'
-                    )
+                for odt, odt_signals in groupby(daq_signals, key=itemgetter('ODT_NUMBER')):
+                    bit_start = 8  # Start after PID (1st byte)
+                    for signal in odt_signals:
+                        original_signal_name = signal['Name']
+                        bit_length = signal['Length'] * 8
+                        long_identifier = signal.get('LongIdentifier', '').strip('"')
+
+                        new_signal_name = dbc_signal_names[original_signal_name]
+
+                        yield signal_line_template.format_map({
+                            "name": new_signal_name,
+                            "pid": pid_counter,
+                            "start_bit": bit_start + start_bit_offset,
+                            "bit_length": bit_length,
+                            "sign": '+' if signal['Signage'] == 'unsigned' else '-',
+                            "scale": signal['Scale'],
+                            "offset": signal['Offset'],
+                            "lower_limit": signal['LowerLimit'],
+                            "upper_limit": signal['UpperLimit'],
+                            "unit": signal['Unit'],
+                        })
                     
-                    # Store signal comment (to be added in the next section)
-                    comment_text = f'{original_signal_name} | {long_identifier}'
-                    signal_comments.append(f'CM_ SG_ {can_id_slave} {new_signal_name} "{comment_text}";')
+                        # Store signal comment (to be added in the next section)
+                        comment_text = f'{original_signal_name} | {long_identifier}'
+                        signal_comments.append(f'CM_ SG_ {can_id_slave} {new_signal_name} "{comment_text}";')
                     
-                    # Add float/double meta data
-                    if signal['Signage'] == "float":
-                        signal_floats.append(f'SIG_VALTYPE_ {can_id_slave} {new_signal_name} : 1;')
-                    if signal['Signage'] == "double":
-                        signal_floats.append(f'SIG_VALTYPE_ {can_id_slave} {new_signal_name} : 2;')
+                        # Add float/double meta data
+                        if signal['Signage'] == "float":
+                            signal_floats.append(f'SIG_VALTYPE_ {can_id_slave} {new_signal_name} : 1;')
+                        if signal['Signage'] == "double":
+                            signal_floats.append(f'SIG_VALTYPE_ {can_id_slave} {new_signal_name} : 2;')
                     
-                    bit_start += bit_length
-                pid_counter += 1
-
-        # Insert all signal comments before the static meta section
-        dbc_content.append("\n")
-        dbc_content.extend(signal_comments)
-        dbc_content.append("\n")
-
-        # Meta section
-        dbc_content.extend([
-            'BA_DEF_ "BusType" STRING ;',
-            'BA_DEF_ "ProtocolType" STRING ;',
-            'BA_DEF_ SG_ "SystemSignalLongSymbol" STRING ;',
-            'BA_DEF_ BO_ "VFrameFormat" ENUM "StandardCAN","ExtendedCAN","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","StandardCAN_FD","ExtendedCAN_FD";',
-            'BA_DEF_ BO_ "MessageIgnore" INT 0 1;',
-            'BA_DEF_ SG_ "SignalIgnore" INT 0 1;',
-            'BA_DEF_DEF_ "BusType" "";',
-            'BA_DEF_DEF_ "ProtocolType" "";',
-            f'BA_DEF_DEF_ "VFrameFormat" "{vframeformat}";',
-            'BA_DEF_DEF_ "MessageIgnore" 0;',
-            'BA_DEF_DEF_ "SignalIgnore" 0;',
-            'BA_DEF_DEF_ "SystemSignalLongSymbol" "";',
-            f'BA_ "BusType" "{bus_type}";',
-            'BA_ "ProtocolType" "";',
-        ])
-
-        # Add "SignalIgnore" for DTOPID message (for use in MF4 decoders)
-        dbc_content.append(f'BA_ "SignalIgnore" SG_ {can_id_slave} DTOPID 1;')
-        
-        # Add signal float section (if any)
-        if len(signal_floats):
-            dbc_content.append("\n")
-            dbc_content.extend(signal_floats)
-            dbc_content.append("\n")
+                        bit_start += bit_length
+                    pid_counter += 1
 
+        # Stream the DBC to disk (lines are newline-separated, without a trailing newline)
         output_dbc = output_dbc.with_suffix(".dbc")
         output_dbc.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_dbc, "w") as f:
-            f.write("\n".join(dbc_content))
-        
-        print(f"Created DBC file: {output_dbc}")
+        with open(output_dbc, "w", buffering=1 << 20) as f:
+            def write_line(line):
+                f.write("\n")
+                f.write(line)
+
+            def write_lines(lines):
+                f.writelines("\n" + line for line in lines)
+
+            f.write("\n".join(dbc_header))
+
+            # DTO Message Definition            
+            write_line(f'BO_ {can_id_slave} DTO: {dlc} Logger')
+            write_line('  SG_ DTOPID M : 0|8@1+ (1,0) [0|255] ""  Logger')
+
+            # Multiplexed signal definitions
+            f.writelines(signal_lines())
+
+            # Insert all signal comments before the static meta section
+            write_line("\n")
+            write_lines(signal_comments)
+            write_line("\n")
+
+            # Meta section
+            write_lines([
+                'BA_DEF_ "BusType" STRING ;',
+                'BA_DEF_ "ProtocolType" STRING ;',
+                'BA_DEF_ SG_ "SystemSignalLongSymbol" STRING ;',
+                'BA_DEF_ BO_ "VFrameFormat" ENUM "StandardCAN","ExtendedCAN","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","reserved","StandardCAN_FD","ExtendedCAN_FD";',
+                'BA_DEF_ BO_ "MessageIgnore" INT 0 1;',
+                'BA_DEF_ SG_ "SignalIgnore" INT 0 1;',
+                'BA_DEF_DEF_ "BusType" "";',
+                'BA_DEF_DEF_ "ProtocolType" "";',
+                f'BA_DEF_DEF_ "VFrameFormat" "{vframeformat}";',
+                'BA_DEF_DEF_ "MessageIgnore" 0;',
+                'BA_DEF_DEF_ "SignalIgnore" 0;',
+                'BA_DEF_DEF_ "SystemSignalLongSymbol" "";',
+                f'BA_ "BusType" "{bus_type}";',
+                'BA_ "ProtocolType" "";',
+            ])
+
+            # Add "SignalIgnore" for DTOPID message (for use in MF4 decoders)
+            write_line(f'BA_ "SignalIgnore" SG_ {can_id_slave} DTOPID 1;')
+        
+            # Add signal float section (if any)
+            if len(signal_floats):
+                write_line("\n")
+                write_lines(signal_floats)
+                write_line("\n")
+
+        logger.info("Created DBC file: %s", output_dbc)
         return output_dbc